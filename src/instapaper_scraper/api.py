@@ -1,8 +1,13 @@
 import logging
+import math
 import os
+import random
 import re
 import time
-from typing import Any
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, cast
 
 import requests
 
@@ -37,10 +42,16 @@ class InstapaperClient:
     # Environment variable names
     ENV_MAX_RETRIES = "MAX_RETRIES"
     ENV_BACKOFF_FACTOR = "BACKOFF_FACTOR"
+    ENV_PREFETCH_PAGES = "PREFETCH_PAGES"
+    ENV_MAX_DELAY = "MAX_DELAY"
+    ENV_RETRY_JITTER = "RETRY_JITTER"
 
     # Default values
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_BACKOFF_FACTOR = 1.0
+    DEFAULT_PREFETCH_PAGES = 0
+    DEFAULT_MAX_DELAY = 30.0
+    DEFAULT_RETRY_JITTER = 0.5
     DEFAULT_REQUEST_TIMEOUT = 30
     DEFAULT_PAGE_START = 1
 
@@ -62,6 +73,17 @@ class InstapaperClient:
     # Maps folder ids to special section types (liked, archive, etc.)
     SPECIAL_SECTIONS = SPECIAL_SECTIONS
 
+    # Optional article fields copied through from the JSON bookmark objects
+    OPTIONAL_FIELDS = (
+        (KEY_AUTHOR, "author"),
+        (KEY_TIME, "time"),
+        (KEY_SITE_NAME, "site_name"),
+        (KEY_LIKED, "liked"),
+        (KEY_IS_ARCHIVED, "is_archived"),
+        (KEY_TAGS, "tags"),
+        (KEY_NOTES, "notes"),
+    )
+
     # Logging and error messages
     MSG_SCRAPING_PAGE = "Scraping page {page}..."
     MSG_BOOKMARK_ID_NOT_FOUND = "Bookmark {bookmark_id} missing {field}."
@@ -86,12 +108,15 @@ class InstapaperClient:
     MSG_SESSION_FETCH_FAILED = "Failed to fetch user session: {e}"
     MSG_SESSION_FETCH_NON_OK = "User session request failed with status {status_code}."
     MSG_PARSE_FAILED = "Could not parse bookmark {id}: {e}"
+    MSG_DUPLICATE_BOOKMARK = "Bookmark {bookmark_id} already seen, skipping."
 
-    def __init__(self, session: requests.Session):
+    def __init__(self, session: requests.Session, prefetch_pages: int | None = None):
         """
         Initializes the client with a requests Session.
         Args:
             session: A requests.Session object, presumably authenticated.
+            prefetch_pages: Pages to request ahead in parallel. Read from the
+                PREFETCH_PAGES environment variable when None.
         """
         self.session = session
         self._form_key: str | None = None
@@ -116,6 +141,42 @@ class InstapaperClient:
             )
             self.backoff_factor = self.DEFAULT_BACKOFF_FACTOR
 
+        try:
+            max_delay = float(
+                os.getenv(self.ENV_MAX_DELAY, str(self.DEFAULT_MAX_DELAY))
+            )
+            # nan or inf would reach time.sleep() and fail the first retry
+            if not math.isfinite(max_delay):
+                raise ValueError(max_delay)
+            self.max_delay = max(0.0, max_delay)
+        except ValueError:
+            logging.warning(
+                f"Invalid value for {self.ENV_MAX_DELAY}, using default {self.DEFAULT_MAX_DELAY}"
+            )
+            self.max_delay = self.DEFAULT_MAX_DELAY
+
+        try:
+            self.retry_jitter = min(
+                1.0,
+                max(
+                    0.0,
+                    float(
+                        os.getenv(self.ENV_RETRY_JITTER, str(self.DEFAULT_RETRY_JITTER))
+                    ),
+                ),
+            )
+        except ValueError:
+            logging.warning(
+                f"Invalid value for {self.ENV_RETRY_JITTER}, using default {self.DEFAULT_RETRY_JITTER}"
+            )
+            self.retry_jitter = self.DEFAULT_RETRY_JITTER
+
+        self.prefetch_pages = (
+            max(0, prefetch_pages)
+            if prefetch_pages is not None
+            else get_prefetch_pages()
+        )
+
     def _get_headers(self) -> dict[str, str]:
         """Builds the headers dict for API requests, including x-form-key."""
         headers = dict(self.HEADERS)
@@ -175,19 +236,7 @@ class InstapaperClient:
                 if not self._form_key:
                     self._fetch_form_key()
 
-                headers = self._get_headers()
-                response = self.session.get(
-                    INSTAPAPER_BOOKMARKS_URL,
-                    params=params,
-                    headers=headers,
-                    timeout=self.DEFAULT_REQUEST_TIMEOUT,
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                if "bookmarks" not in data:
-                    raise InstapaperAPIError(self.MSG_INVALID_JSON)
-
+                data = self._request_page(params)
                 bookmarks = data.get("bookmarks", [])
                 has_more = data.get("has_more", False)
 
@@ -229,6 +278,24 @@ class InstapaperClient:
             raise last_exception
         raise Exception(self.MSG_SCRAPING_FAILED_UNKNOWN)
 
+    def _request_page(self, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Makes a single bookmarks request and returns the decoded payload.
+        Errors are raised, not logged or retried; callers decide how to react.
+        """
+        response = self.session.get(
+            INSTAPAPER_BOOKMARKS_URL,
+            params=params,
+            headers=self._get_headers(),
+            timeout=self.DEFAULT_REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        if "bookmarks" not in data:
+            raise InstapaperAPIError(self.MSG_INVALID_JSON)
+        return cast(dict[str, Any], data)
+
     def _build_request_params(
         self, page: int, folder_info: dict[str, str] | None
     ) -> dict[str, Any]:
@@ -288,15 +355,7 @@ class InstapaperClient:
                 if add_article_preview:
                     article[KEY_ARTICLE_PREVIEW] = bm.get(KEY_DESCRIPTION, "")
 
-                for key, json_key in [
-                    (KEY_AUTHOR, "author"),
-                    (KEY_TIME, "time"),
-                    (KEY_SITE_NAME, "site_name"),
-                    (KEY_LIKED, "liked"),
-                    (KEY_IS_ARCHIVED, "is_archived"),
-                    (KEY_TAGS, "tags"),
-                    (KEY_NOTES, "notes"),
-                ]:
+                for key, json_key in self.OPTIONAL_FIELDS:
                     if json_key in bm:
                         article[key] = bm[json_key]
 
@@ -319,7 +378,34 @@ class InstapaperClient:
             folder_info: A dictionary containing 'id' and 'slug' of the folder to fetch articles from.
             add_article_preview: Whether to include the article preview.
         """
+        if self.prefetch_pages > 0:
+            pages = self._iter_pages_prefetched(limit, folder_info, add_article_preview)
+        else:
+            pages = self._iter_pages(limit, folder_info, add_article_preview)
+
         all_articles = []
+        # Bookmarks can shift between pages if articles are saved mid-scrape.
+        seen_ids: set[str] = set()
+        for data in pages:
+            for article in data:
+                article_id = article.get(KEY_ID)
+                if article_id is not None:
+                    if article_id in seen_ids:
+                        logging.debug(
+                            self.MSG_DUPLICATE_BOOKMARK.format(bookmark_id=article_id)
+                        )
+                        continue
+                    seen_ids.add(article_id)
+                all_articles.append(article)
+        return all_articles
+
+    def _iter_pages(
+        self,
+        limit: int | None,
+        folder_info: dict[str, str] | None,
+        add_article_preview: bool,
+    ) -> Iterator[list[dict[str, str]]]:
+        """Fetches pages one after another, yielding each page's articles."""
         page = self.DEFAULT_PAGE_START
         has_more = True
         while has_more:
@@ -333,10 +419,78 @@ class InstapaperClient:
                 folder_info=folder_info,
                 add_article_preview=add_article_preview,
             )
-            if data:
-                all_articles.extend(data)
+            yield data
             page += 1
-        return all_articles
+
+    def _iter_pages_prefetched(
+        self,
+        limit: int | None,
+        folder_info: dict[str, str] | None,
+        add_article_preview: bool,
+    ) -> Iterator[list[dict[str, str]]]:
+        """
+        Fetches pages in order while speculatively requesting the next
+        `prefetch_pages` pages in background threads, so network latency
+        overlaps with processing of the current page.
+
+        Speculative requests make a single silent attempt. Pages past the
+        end may fail or come back empty, and are simply discarded; a page
+        that is actually needed but failed is fetched again through
+        get_articles, with its usual retries and error logging.
+        """
+        # Fetch the form key up front so worker threads don't race for it.
+        self._fetch_form_key()
+
+        next_page = self.DEFAULT_PAGE_START
+        in_flight: deque[tuple[int, Future[dict[str, Any]]]] = deque()
+
+        executor = ThreadPoolExecutor(max_workers=self.prefetch_pages + 1)
+        completed = False
+        try:
+
+            def submit_next() -> None:
+                nonlocal next_page
+                if limit is not None and next_page > limit:
+                    return
+                params = self._build_request_params(next_page, folder_info)
+                in_flight.append(
+                    (next_page, executor.submit(self._request_page, params))
+                )
+                next_page += 1
+
+            for _ in range(self.prefetch_pages + 1):
+                submit_next()
+
+            has_more = True
+            while in_flight:
+                page, future = in_flight.popleft()
+                logging.info(self.MSG_SCRAPING_PAGE.format(page=page))
+                try:
+                    payload = future.result()
+                except Exception:
+                    data, has_more = self.get_articles(
+                        page=page,
+                        folder_info=folder_info,
+                        add_article_preview=add_article_preview,
+                    )
+                else:
+                    data = self._parse_bookmarks(
+                        payload.get("bookmarks", []), add_article_preview
+                    )
+                    has_more = payload.get("has_more", False)
+                yield data
+                if not has_more:
+                    break
+                submit_next()
+            completed = True
+        finally:
+            # After a complete scrape, let the remaining speculative requests
+            # (one attempt each) finish so none outlive this call. On an error,
+            # don't hold it back until they time out.
+            executor.shutdown(wait=completed, cancel_futures=True)
+
+        if has_more and limit is not None:
+            logging.info(f"Reached page limit of {limit}.")
 
     def _handle_http_error(
         self, e: requests.exceptions.HTTPError, attempt: int
@@ -381,8 +535,13 @@ class InstapaperClient:
             return False
 
     def _wait_for_retry(self, attempt: int, reason: str) -> None:
-        """Calculates and waits for an exponential backoff period."""
-        sleep_time = self.backoff_factor * (2**attempt)
+        """
+        Calculates and waits for a capped exponential backoff period.
+        Up to `retry_jitter` of the computed delay is randomly shaved off,
+        so that concurrent retries do not hit the server in lockstep.
+        """
+        sleep_time = min(self.max_delay, self.backoff_factor * (2**attempt))
+        sleep_time *= 1.0 - self.retry_jitter + random.random() * self.retry_jitter
         logging.warning(
             self.MSG_RETRY_ATTEMPT.format(
                 reason=reason,
@@ -392,3 +551,17 @@ class InstapaperClient:
             )
         )
         time.sleep(sleep_time)
+
+
+def get_prefetch_pages() -> int:
+    """
+    Reads the prefetch depth from the PREFETCH_PAGES environment variable.
+    Shared with the CLI so the connection pool can be sized to match.
+    """
+    env_name = InstapaperClient.ENV_PREFETCH_PAGES
+    default = InstapaperClient.DEFAULT_PREFETCH_PAGES
+    try:
+        return max(0, int(os.getenv(env_name, str(default))))
+    except ValueError:
+        logging.warning(f"Invalid value for {env_name}, using default {default}")
+        return default
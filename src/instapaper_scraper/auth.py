@@ -1,8 +1,11 @@
 import getpass
+import json
 import logging
 import os
 import stat
+import threading
 from pathlib import Path
+from typing import Any
 
 import requests
 from cryptography.fernet import Fernet
@@ -38,14 +41,15 @@ class InstapaperAuthenticator:
     INSTAPAPER_LOGIN_URL = f"{INSTAPAPER_BASE_URL}/user/login"
 
     # Session/Cookie related
-    COOKIE_PART_COUNT = 3
-    REQUIRED_COOKIES = {"pfus", "pfps", "pfhs"}
-    LOGIN_FORM_IDENTIFIER = "login_form"
+    COOKIE_FIELDS = ("name", "value", "domain", "path", "expires", "secure")
+    REQUIRED_COOKIES = frozenset({"pfus", "pfps", "pfhs"})
+    LOGIN_FORM_IDENTIFIER = b"login_form"
     LOGIN_SUCCESS_PATH = "/home"
     XSRF_COOKIE_NAME = "_xsrf"
 
     # Request related
     REQUEST_TIMEOUT = 10
+    VERIFY_CHUNK_SIZE = 16 * 1024
 
     # Prompts
     PROMPT_USERNAME = "Enter your Instapaper username: "
@@ -112,14 +116,8 @@ class InstapaperAuthenticator:
 
             decrypted_data = self.fernet.decrypt(encrypted_data).decode("utf-8")
 
-            for line in decrypted_data.splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                parts = line.split(":", 2)
-                if len(parts) == self.COOKIE_PART_COUNT:
-                    name, value, domain = parts
-                    self.session.cookies.set(name, value, domain=domain)
+            for cookie in self._deserialize_cookies(decrypted_data):
+                self.session.cookies.set(**cookie)
 
             if self.session.cookies and self._verify_session():
                 logging.info(self.LOG_SESSION_LOAD_SUCCESS)
@@ -137,19 +135,63 @@ class InstapaperAuthenticator:
             self.session_file.unlink(missing_ok=True)
             return False
 
+    def _deserialize_cookies(self, data: str) -> list[dict[str, Any]]:
+        """
+        Parses decrypted session data into keyword arguments for cookies.set().
+        Falls back to the legacy "name:value:domain" line format.
+        """
+        try:
+            return [
+                {
+                    field: cookie[field]
+                    for field in self.COOKIE_FIELDS
+                    if field in cookie
+                }
+                for cookie in json.loads(data)
+            ]
+        except ValueError:
+            pass
+
+        cookies = []
+        for line in data.splitlines():
+            # Domains never contain ':', so split the domain off the right to
+            # keep any ':' inside the cookie value intact.
+            name, _, rest = line.strip().partition(":")
+            value, sep, domain = rest.rpartition(":")
+            if name and sep:
+                cookies.append({"name": name, "value": value, "domain": domain})
+        return cookies
+
     def _verify_session(self) -> bool:
         """Checks if the current session is valid by making a request."""
         try:
-            verify_response = self.session.get(
+            # Stream the page so reading can stop as soon as the login form
+            # marker is found, instead of downloading and decoding it all.
+            with self.session.get(
                 self.INSTAPAPER_VERIFY_URL,
                 timeout=self.REQUEST_TIMEOUT,
-            )
-            verify_response.raise_for_status()
-            return self.LOGIN_FORM_IDENTIFIER not in verify_response.text
+                stream=True,
+            ) as verify_response:
+                verify_response.raise_for_status()
+                return not self._response_contains(
+                    verify_response, self.LOGIN_FORM_IDENTIFIER
+                )
         except requests.RequestException as e:
             logging.error(self.LOG_SESSION_VERIFY_FAILED.format(e=e))
             return False
 
+    def _response_contains(self, response: requests.Response, marker: bytes) -> bool:
+        """Scans a streamed response body for marker, stopping at the first match."""
+        tail = b""
+        for chunk in response.iter_content(chunk_size=self.VERIFY_CHUNK_SIZE):
+            # Keep the end of the previous chunk so a marker split across
+            # two chunks is still found.
+            window = tail + chunk
+            if marker in window:
+                return True
+            tail = window[max(0, len(window) - len(marker) + 1) :]
+        return False
+
     def _fetch_csrf_token(self) -> tuple[bool, str | None]:
         """Fetches the CSRF token via a preflight GET to the login page.
 
@@ -157,12 +199,23 @@ class InstapaperAuthenticator:
             A tuple of (success, token). On success the token may still be None
             if the server did not set the cookie.
         """
+        return self._check_csrf_response(self._get_login_page())
+
+    def _get_login_page(self) -> requests.Response | requests.RequestException:
+        """Requests the login page, returning the network error instead of raising."""
         try:
-            response = self.session.get(
+            return self.session.get(
                 self.INSTAPAPER_LOGIN_URL, timeout=self.REQUEST_TIMEOUT
             )
         except requests.RequestException as e:
-            logging.error(self.LOG_CSRF_FETCH_NETWORK_FAILED.format(e=e))
+            return e
+
+    def _check_csrf_response(
+        self, response: requests.Response | requests.RequestException
+    ) -> tuple[bool, str | None]:
+        """Logs a failed preflight, or returns the CSRF token it set."""
+        if isinstance(response, requests.RequestException):
+            logging.error(self.LOG_CSRF_FETCH_NETWORK_FAILED.format(e=response))
             return False, None
 
         if response.status_code == 403:
@@ -178,17 +231,31 @@ class InstapaperAuthenticator:
         username = self.username
         password = self.password
 
+        # Preflight GET to obtain the _xsrf cookie Instapaper now requires
+        # on the login POST body; without it the server returns 403.
         if not username or not password:
+            # Run the preflight while the user types, so the TLS handshake
+            # and round-trip are hidden behind the credential prompt. The
+            # thread is a daemon so Ctrl-C or EOF at the prompt is not held
+            # up by the request, and any failure is only logged afterwards.
+            preflight: list[requests.Response | requests.RequestException] = []
+            preflight_thread = threading.Thread(
+                target=lambda: preflight.append(self._get_login_page()),
+                daemon=True,
+            )
+            preflight_thread.start()
             username = input(self.PROMPT_USERNAME)
             password = getpass.getpass(self.PROMPT_PASSWORD)
-        elif self.username:
+            preflight_thread.join()
+            ok, xsrf = self._check_csrf_response(
+                preflight[0] if preflight else self._get_login_page()
+            )
+        else:
             logging.info(
                 f"Using username '{self.username}' from command-line arguments."
             )
+            ok, xsrf = self._fetch_csrf_token()
 
-        # Preflight GET to obtain the _xsrf cookie Instapaper now requires
-        # on the login POST body; without it the server returns 403.
-        ok, xsrf = self._fetch_csrf_token()
         if not ok:
             return False
 
@@ -229,14 +296,24 @@ class InstapaperAuthenticator:
             logging.warning(self.LOG_NO_KNOWN_COOKIE_TO_SAVE)
             return
 
-        cookie_data = ""
-        for cookie in cookies_to_save:
-            cookie_data += f"{cookie.name}:{cookie.value}:{cookie.domain}\n"
+        cookie_data = json.dumps(
+            [
+                {field: getattr(c, field) for field in self.COOKIE_FIELDS}
+                for c in cookies_to_save
+            ]
+        )
 
         encrypted_data = self.fernet.encrypt(cookie_data.encode("utf-8"))
 
         self.session_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.session_file, "wb") as f:
+        # Create the file owner-only, so it is never briefly readable under
+        # the default umask; chmod still tightens a pre-existing file.
+        fd = os.open(
+            self.session_file,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            stat.S_IRUSR | stat.S_IWUSR,
+        )
+        with os.fdopen(fd, "wb") as f:
             f.write(encrypted_data)
 
         os.chmod(self.session_file, stat.S_IRUSR | stat.S_IWUSR)
@@ -5,14 +5,10 @@ from pathlib import Path
 from typing import Any, cast
 
 import requests
-
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
+from requests.adapters import HTTPAdapter
 
 from . import __version__
-from .api import InstapaperClient
+from .api import InstapaperClient, get_prefetch_pages
 from .auth import InstapaperAuthenticator
 from .constants import CONFIG_DIR, SUPPORTED_FORMATS
 from .exceptions import InstapaperAPIError
@@ -24,6 +20,24 @@ DEFAULT_SESSION_FILENAME = ".instapaper_session"
 DEFAULT_KEY_FILENAME = ".session_key"
 DEFAULT_OUTPUT_FILENAME = "output/bookmarks.{ext}"
 
+# All traffic goes to a single host, so one keep-alive pool is enough.
+HTTP_POOL_CONNECTIONS = 1
+HTTP_POOL_MAXSIZE = 10
+
+
+def _create_session(prefetch_pages: int = 0) -> requests.Session:
+    """
+    Creates a requests Session with a connection pool sized for Instapaper.
+    The pool holds at least one connection per concurrent page request.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=max(HTTP_POOL_MAXSIZE, prefetch_pages + 1),
+    )
+    session.mount("https://", adapter)
+    return session
+
 
 def _resolve_path(
     arg_path: str, working_dir_filename: str, user_dir_filename: Path
@@ -46,6 +60,12 @@ def load_config(config_path_str: str | None = None) -> dict[str, Any] | None:
     It checks the provided path, then config.toml in the project root,
     and finally ~/.config/instapaper-scraper/config.toml.
     """
+    # Imported here so --help and --version don't pay for the TOML parser.
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
     default_paths = [
         Path(CONFIG_FILENAME),
         CONFIG_DIR / CONFIG_FILENAME,
@@ -57,24 +77,29 @@ def load_config(config_path_str: str | None = None) -> dict[str, Any] | None:
     paths_to_check.extend(default_paths)
 
     for path in paths_to_check:
-        if path.is_file():
-            try:
-                with open(path, "rb") as f:
-                    logging.info(f"Loading configuration from {path}")
-                    return cast(dict[str, Any], tomllib.load(f))
-            except tomllib.TOMLDecodeError as e:
-                logging.error(f"Error decoding TOML file at {path}: {e}")
-                return None
+        # Open directly instead of probing with is_file() first; a missing
+        # candidate costs one failed open rather than a stat plus an open.
+        try:
+            with open(path, "rb") as f:
+                logging.info(f"Loading configuration from {path}")
+                return cast(dict[str, Any], tomllib.load(f))
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            continue
+        except PermissionError:
+            # Windows raises PermissionError, not IsADirectoryError, when
+            # opening a directory; skip it like any other non-file candidate.
+            if path.is_dir():
+                continue
+            raise
+        except tomllib.TOMLDecodeError as e:
+            logging.error(f"Error decoding TOML file at {path}: {e}")
+            return None
     logging.info("No configuration file found at any default location.")
     return None
 
 
-def main() -> None:
-    """
-    Main entry point for the Instapaper scraper CLI.
-    """
-    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
-
+def _build_parser() -> argparse.ArgumentParser:
+    """Builds the CLI argument parser."""
     parser = argparse.ArgumentParser(description="Scrape Instapaper articles.")
     parser.add_argument(
         "-v",
@@ -121,11 +146,26 @@ def main() -> None:
         default=None,
         help="Maximum number of pages to scrape (default: unlimited)",
     )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=None,
+        help="Number of pages to fetch ahead in parallel (default: 0, sequential)",
+    )
     parser.add_argument(
         "--folder",
         help="Folder key, ID, or slug to scrape. Use 'none' to disable folder mode.",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    """
+    Main entry point for the Instapaper scraper CLI.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+    args = _build_parser().parse_args()
 
     config = load_config(args.config_path)
     folders = config.get("folders", []) if config else []
@@ -153,131 +193,149 @@ def main() -> None:
         else fields_config.get("article_preview", False)
     )
 
-    session = requests.Session()
-
-    # Resolve session and key file paths
-    session_file = _resolve_path(
-        args.session_file,
-        DEFAULT_SESSION_FILENAME,
-        CONFIG_DIR / DEFAULT_SESSION_FILENAME,
-    )
-    key_file = _resolve_path(
-        args.key_file,
-        DEFAULT_KEY_FILENAME,
-        CONFIG_DIR / DEFAULT_KEY_FILENAME,
+    # Resolve the prefetch depth once, so the connection pool and the client
+    # agree on it whether it comes from --prefetch or PREFETCH_PAGES.
+    prefetch_pages = (
+        max(0, args.prefetch) if args.prefetch is not None else get_prefetch_pages()
     )
+    session = _create_session(prefetch_pages)
+    try:
+        # Resolve session and key file paths
+        session_file = _resolve_path(
+            args.session_file,
+            DEFAULT_SESSION_FILENAME,
+            CONFIG_DIR / DEFAULT_SESSION_FILENAME,
+        )
+        key_file = _resolve_path(
+            args.key_file,
+            DEFAULT_KEY_FILENAME,
+            CONFIG_DIR / DEFAULT_KEY_FILENAME,
+        )
 
-    # 1. Authenticate
-    authenticator = InstapaperAuthenticator(
-        session,
-        session_file=session_file,
-        key_file=key_file,
-        username=args.username,
-        password=args.password,
-    )
-    if not authenticator.login():
-        logging.error("Authentication failed. Check your credentials or session file.")
-        sys.exit(1)  # Exit if login fails
-
-    # 2. Determine Folder
-    if args.folder:
-        if args.folder.lower() == "none":
-            selected_folder = None
-        elif args.folder.lower() in ("liked", "archive"):
-            selected_folder = {"id": args.folder.lower()}
-        else:
-            if not config:
-                logging.error(
-                    "Configuration file not found or failed to load. The --folder option requires a configuration file for custom folders."
+        # 1. Authenticate
+        authenticator = InstapaperAuthenticator(
+            session,
+            session_file=session_file,
+            key_file=key_file,
+            username=args.username,
+            password=args.password,
+        )
+        if not authenticator.login():
+            logging.error(
+                "Authentication failed. Check your credentials or session file."
+            )
+            sys.exit(1)  # Exit if login fails
+
+        # 2. Determine Folder
+        if args.folder:
+            if args.folder.lower() == "none":
+                selected_folder = None
+            elif args.folder.lower() in ("liked", "archive"):
+                selected_folder = {"id": args.folder.lower()}
+            else:
+                if not config:
+                    logging.error(
+                        "Configuration file not found or failed to load. The --folder option requires a configuration file for custom folders."
+                    )
+                    sys.exit(1)
+
+                for f in folders:
+                    if args.folder in (f.get("key"), str(f.get("id")), f.get("slug")):
+                        selected_folder = f
+                        break
+                if not selected_folder:
+                    # If folder is not in config, treat it as a folder ID
+                    selected_folder = {"id": args.folder}
+        elif folders:
+            print("Available folders:")
+            folder_choices: list[dict[str, Any]] = [
+                {"display": "__Home__ (scrape unfiled articles)", "info": None},
+                {
+                    "display": "__Liked__ (scrape liked articles)",
+                    "info": {"id": "liked"},
+                },
+                {
+                    "display": "__Archive__ (scrape archived articles)",
+                    "info": {"id": "archive"},
+                },
+            ]
+            for folder in folders:
+                display_name = (
+                    folder.get("key") or folder.get("slug") or folder.get("id")
+                )
+                folder_choices.append({"display": display_name, "info": folder})
+
+            print(
+                "\n".join(
+                    f"  {i}: {choice['display']}"
+                    for i, choice in enumerate(folder_choices)
                 )
-                sys.exit(1)
-
-            for f in folders:
-                if args.folder in (f.get("key"), str(f.get("id")), f.get("slug")):
-                    selected_folder = f
-                    break
-            if not selected_folder:
-                # If folder is not in config, treat it as a folder ID
-                selected_folder = {"id": args.folder}
-    elif folders:
-        print("Available folders:")
-        folder_choices: list[dict[str, Any]] = [
-            {"display": "__Home__ (scrape unfiled articles)", "info": None},
-            {"display": "__Liked__ (scrape liked articles)", "info": {"id": "liked"}},
-            {
-                "display": "__Archive__ (scrape archived articles)",
-                "info": {"id": "archive"},
-            },
-        ]
-        for folder in folders:
-            display_name = folder.get("key") or folder.get("slug") or folder.get("id")
-            folder_choices.append({"display": display_name, "info": folder})
-
-        for i, choice in enumerate(folder_choices):
-            print(f"  {i}: {choice['display']}")
+            )
+
+            try:
+                choice_str = input(
+                    f"Select a folder (enter a number 0-{len(folder_choices) - 1})[default: 0]: "
+                )
+                choice_idx = int(choice_str) if choice_str else 0
+                if 0 <= choice_idx < len(folder_choices):
+                    selected_folder = folder_choices[choice_idx]["info"]
+                else:
+                    print("Invalid selection. Continuing with no folder selected.")
+            except (ValueError, IndexError):
+                print("Invalid input. Continuing with no folder selected.")
 
+        # Determine output filename
+        output_filename = args.output
+        if not output_filename:
+            if config:
+                folder_id = selected_folder.get("id") if selected_folder else None
+                if folder_id == "liked":
+                    output_filename = config.get("liked_output_filename")
+                elif folder_id == "archive":
+                    output_filename = config.get("archive_output_filename")
+                elif selected_folder:
+                    output_filename = selected_folder.get("output_filename")
+                else:  # Not in folder mode
+                    output_filename = config.get("output_filename")
+
+        if not output_filename:
+            ext = "db" if final_format == "sqlite" else final_format
+            output_filename = DEFAULT_OUTPUT_FILENAME.format(ext=ext)
+
+        # 3. Scrape Articles
+        client = InstapaperClient(session, prefetch_pages=prefetch_pages)
         try:
-            choice_str = input(
-                f"Select a folder (enter a number 0-{len(folder_choices) - 1})[default: 0]: "
+            folder_info = selected_folder if selected_folder else None
+            all_articles = client.get_all_articles(
+                limit=args.limit,
+                folder_info=folder_info,
+                add_article_preview=final_add_article_preview,
             )
-            choice_idx = int(choice_str) if choice_str else 0
-            if 0 <= choice_idx < len(folder_choices):
-                selected_folder = folder_choices[choice_idx]["info"]
-            else:
-                print("Invalid selection. Continuing with no folder selected.")
-        except (ValueError, IndexError):
-            print("Invalid input. Continuing with no folder selected.")
-
-    # Determine output filename
-    output_filename = args.output
-    if not output_filename:
-        if config:
-            folder_id = selected_folder.get("id") if selected_folder else None
-            if folder_id == "liked":
-                output_filename = config.get("liked_output_filename")
-            elif folder_id == "archive":
-                output_filename = config.get("archive_output_filename")
-            elif selected_folder:
-                output_filename = selected_folder.get("output_filename")
-            else:  # Not in folder mode
-                output_filename = config.get("output_filename")
-
-    if not output_filename:
-        ext = "db" if final_format == "sqlite" else final_format
-        output_filename = DEFAULT_OUTPUT_FILENAME.format(ext=ext)
-
-    # 3. Scrape Articles
-    client = InstapaperClient(session)
-    try:
-        folder_info = selected_folder if selected_folder else None
-        all_articles = client.get_all_articles(
-            limit=args.limit,
-            folder_info=folder_info,
-            add_article_preview=final_add_article_preview,
-        )
-    except InstapaperAPIError as e:
-        logging.error(f"Stopping scraper due to an unrecoverable error: {e}")
-        sys.exit(1)
-    except requests.exceptions.RequestException as e:
-        logging.error(f"An HTTP error occurred: {e}")
-        sys.exit(1)
-    except Exception as e:
-        logging.error(f"An unexpected error occurred during scraping: {e}")
-        sys.exit(1)
-
-    # 4. Save Articles
-    try:
-        save_articles(
-            all_articles,
-            final_format,
-            output_filename,
-            add_instapaper_url=final_add_instapaper_url,
-            add_article_preview=final_add_article_preview,
-        )
-        logging.info("Articles scraped and saved successfully.")
-    except Exception as e:
-        logging.error(f"An unexpected error occurred during saving: {e}")
-        sys.exit(1)
+        except InstapaperAPIError as e:
+            logging.error(f"Stopping scraper due to an unrecoverable error: {e}")
+            sys.exit(1)
+        except requests.exceptions.RequestException as e:
+            logging.error(f"An HTTP error occurred: {e}")
+            sys.exit(1)
+        except Exception as e:
+            logging.error(f"An unexpected error occurred during scraping: {e}")
+            sys.exit(1)
+
+        # 4. Save Articles
+        try:
+            save_articles(
+                all_articles,
+                final_format,
+                output_filename,
+                add_instapaper_url=final_add_instapaper_url,
+                add_article_preview=final_add_article_preview,
+            )
+            logging.info("Articles scraped and saved successfully.")
+        except Exception as e:
+            logging.error(f"An unexpected error occurred during saving: {e}")
+            sys.exit(1)
+    finally:
+        session.close()
 
 
 if __name__ == "__main__":
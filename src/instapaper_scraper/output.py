@@ -13,6 +13,8 @@ from .constants import (
 
 # Constants for file operations
 JSON_INDENT = 4
+# Large enough that a typical export reaches disk in a handful of writes.
+WRITE_BUFFER_SIZE = 1 << 20
 
 # Constants for SQLite output
 SQLITE_TABLE_NAME = "articles"
@@ -54,7 +56,9 @@ def get_sqlite_create_table_sql(
     if add_article_preview:
         columns.append(f"{KEY_ARTICLE_PREVIEW} TEXT")
 
-    return f"CREATE TABLE IF NOT EXISTS {SQLITE_TABLE_NAME} ({', '.join(columns)})"
+    # WITHOUT ROWID clusters rows on the id primary key, so each insert
+    # updates one B-tree instead of a rowid table plus a separate id index.
+    return f"CREATE TABLE IF NOT EXISTS {SQLITE_TABLE_NAME} ({', '.join(columns)}) WITHOUT ROWID"
 
 
 def get_sqlite_insert_sql(
@@ -75,6 +79,14 @@ def get_sqlite_insert_sql(
     return f"INSERT OR REPLACE INTO {SQLITE_TABLE_NAME} ({', '.join(cols)}) VALUES ({', '.join(placeholders)})"
 
 
+def _ensure_dir(filename: str) -> None:
+    """Creates the parent directory of filename if it does not exist yet."""
+    directory = os.path.dirname(filename)
+    # A bare filename lives in the working directory, which already exists.
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+
+
 def save_to_csv(
     data: list[dict[str, Any]],
     filename: str,
@@ -84,8 +96,10 @@ def save_to_csv(
     """Saves a list of articles to a CSV file."""
     import csv
 
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
-    with open(filename, "w", newline="", encoding="utf-8") as f:
+    _ensure_dir(filename)
+    with open(
+        filename, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+    ) as f:
         fieldnames = [KEY_ID, KEY_TITLE, KEY_URL]
         if add_instapaper_url:
             # Insert instapaper_url after the id column
@@ -93,11 +107,24 @@ def save_to_csv(
         if add_article_preview:
             fieldnames.append(KEY_ARTICLE_PREVIEW)
 
-        writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
-        writer.writeheader()
-        writer.writerows(
-            {k: v for k, v in row.items() if k in fieldnames} for row in data
+        # extrasaction="ignore" drops keys outside fieldnames (author, tags,
+        # ...) without building a filtered copy of every row.
+        writer = csv.DictWriter(
+            f, fieldnames=fieldnames, quoting=csv.QUOTE_ALL, extrasaction="ignore"
         )
+        writer.writeheader()
+        if add_instapaper_url:
+            # Add the read URL row by row as it is written, rather than
+            # holding a second copy of every article in memory.
+            writer.writerows(
+                {
+                    **row,
+                    SQLITE_INSTAPAPER_URL_COL: f"{INSTAPAPER_READ_URL}{row[KEY_ID]}",
+                }
+                for row in data
+            )
+        else:
+            writer.writerows(data)
 
     logging.info(LOG_SAVED_ARTICLES.format(count=len(data), filename=filename))
 
@@ -109,7 +136,7 @@ def save_to_json(
     """Saves a list of articles to a JSON file."""
     import json
 
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    _ensure_dir(filename)
     with open(filename, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=JSON_INDENT, ensure_ascii=False)
     logging.info(LOG_SAVED_ARTICLES.format(count=len(data), filename=filename))
@@ -124,10 +151,9 @@ def save_to_sqlite(
     """Saves a list of articles to a SQLite database."""
     import sqlite3
 
-    os.makedirs(os.path.dirname(db_name), exist_ok=True)
+    _ensure_dir(db_name)
     conn = sqlite3.connect(db_name)
     cursor = conn.cursor()
-    cursor.execute(get_sqlite_create_table_sql(add_instapaper_url, add_article_preview))
 
     # For older SQLite versions, we need to manually add the URL
     manual_insert_required = add_instapaper_url and sqlite3.sqlite_version_info < (
@@ -150,10 +176,16 @@ def save_to_sqlite(
         add_instapaper_url_manually=manual_insert_required,
         add_article_preview=add_article_preview,
     )
-    cursor.executemany(insert_sql, data_to_insert)
-
-    conn.commit()
-    conn.close()
+    try:
+        # The connection context manager commits all rows at once, or
+        # rolls back if any insert fails.
+        with conn:
+            cursor.execute(
+                get_sqlite_create_table_sql(add_instapaper_url, add_article_preview)
+            )
+            cursor.executemany(insert_sql, data_to_insert)
+    finally:
+        conn.close()
     logging.info(LOG_SAVED_ARTICLES.format(count=len(data), filename=db_name))
 
 
@@ -220,8 +252,9 @@ def save_articles(
 
     filename = _correct_ext(filename, format)
 
-    # Add the instapaper_url to the data for formats that don't auto-generate it
-    if add_instapaper_url and format in ("csv", "json"):
+    # JSON needs the instapaper_url in the data itself; CSV adds it while
+    # writing and SQLite generates it.
+    if add_instapaper_url and format == "json":
         data = [
             {
                 **article,
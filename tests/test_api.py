@@ -1,5 +1,7 @@
 import logging
 import re
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -174,6 +176,249 @@ def test_get_all_articles_multiple_pages(client, session):
         assert_article_data(all_articles[3], "4", "Article 4", "http://example.com/4")
 
 
+def test_get_all_articles_skips_duplicates_across_pages(client, session):
+    """Test that a bookmark shifted onto the next page is only returned once."""
+    page_2 = get_mock_bookmarks_json(page_num=2, has_more=False)
+    # Simulate article 2 being pushed onto page 2 by a newly saved bookmark.
+    page_2["bookmarks"].insert(0, get_mock_bookmarks_json(page_num=1)["bookmarks"][1])
+    with requests_mock.Mocker() as m:
+        setup_session_mock(m)
+        m.get(
+            INSTAPAPER_BOOKMARKS_URL + "?section_type=home&page=1&sort=newest",
+            json=get_mock_bookmarks_json(page_num=1, has_more=True),
+        )
+        m.get(
+            INSTAPAPER_BOOKMARKS_URL + "?section_type=home&page=2&sort=newest",
+            json=page_2,
+        )
+
+        all_articles = client.get_all_articles()
+
+    assert [article["id"] for article in all_articles] == ["1", "2", "3", "4"]
+
+
+def test_get_all_articles_with_prefetch(session):
+    """Test that prefetching pages returns the same articles in page order."""
+    client = InstapaperClient(session)
+    client.prefetch_pages = 2
+    with requests_mock.Mocker() as m:
+        setup_session_mock(m)
+        for page_num, has_more in [(1, True), (2, True), (3, False)]:
+            m.get(
+                INSTAPAPER_BOOKMARKS_URL
+                + f"?section_type=home&page={page_num}&sort=newest",
+                json=get_mock_bookmarks_json(page_num=page_num, has_more=has_more),
+            )
+        # Speculative requests past the last page get an empty page.
+        for page_num in (4, 5):
+            m.get(
+                INSTAPAPER_BOOKMARKS_URL
+                + f"?section_type=home&page={page_num}&sort=newest",
+                json={"bookmarks": [], "has_more": False},
+            )
+
+        all_articles = client.get_all_articles()
+
+    assert [article["id"] for article in all_articles] == [
+        "1",
+        "2",
+        "3",
+        "4",
+        "5",
+        "6",
+    ]
+
+
+def test_get_all_articles_prefetch_ignores_errors_past_last_page(
+    session, caplog, monkeypatch
+):
+    """Test that failing speculative pages past the end are silently dropped."""
+    mock_sleep = MagicMock()
+    monkeypatch.setattr("time.sleep", mock_sleep)
+    client = InstapaperClient(session)
+    client.prefetch_pages = 2
+    with caplog.at_level(logging.INFO), requests_mock.Mocker() as m:
+        setup_session_mock(m)
+        m.get(
+            INSTAPAPER_BOOKMARKS_URL + "?section_type=home&page=1&sort=newest",
+            json=get_mock_bookmarks_json(page_num=1, has_more=False),
+        )
+        m.get(
+            INSTAPAPER_BOOKMARKS_URL + "?section_type=home&page=2&sort=newest",
+            status_code=404,
+        )
+        m.get(
+            INSTAPAPER_BOOKMARKS_URL + "?section_type=home&page=3&sort=newest",
+            status_code=500,
+        )
+
+        all_articles = client.get_all_articles()
+
+    assert [article["id"] for article in all_articles] == ["1", "2"]
+    assert not [r for r in caplog.records if r.levelno >= logging.WARNING]
+    assert "Scraping page 1..." in caplog.text
+    assert "Scraping page 2..." not in caplog.text
+    mock_sleep.assert_not_called()
+
+
+def test_get_all_articles_prefetch_refetches_failed_needed_page(session, monkeypatch):
+    """Test that a needed page whose speculative fetch failed is retried."""
+    monkeypatch.setattr("time.sleep", MagicMock())
+    client = InstapaperClient(session)
+    client.prefetch_pages = 1
+    with requests_mock.Mocker() as m:
+        setup_session_mock(m)
+        m.get(
+            INSTAPAPER_BOOKMARKS_URL + "?section_type=home&page=1&sort=newest",
+            json=get_mock_bookmarks_json(page_num=1, has_more=True),
+        )
+        m.get(
+            INSTAPAPER_BOOKMARKS_URL + "?section_type=home&page=2&sort=newest",
+            [
+                {"status_code": 500},
+                {"json": get_mock_bookmarks_json(page_num=2, has_more=False)},
+            ],
+        )
+
+        all_articles = client.get_all_articles()
+
+    assert [article["id"] for article in all_articles] == ["1", "2", "3", "4"]
+
+
+def test_get_all_articles_prefetch_error_not_delayed_by_speculative_pages(
+    session,
+):
+    """Test that an unrecoverable error is raised without waiting on prefetches."""
+    client = InstapaperClient(session)
+    client.prefetch_pages = 1
+    release = threading.Event()
+
+    def request_page(params):
+        if params["page"] == 1:
+            raise requests.exceptions.HTTPError("403 Client Error")
+        release.wait(timeout=5)
+        return {"bookmarks": [], "has_more": False}
+
+    try:
+        with (
+            patch.object(client, "_request_page", side_effect=request_page),
+            patch.object(
+                client,
+                "get_articles",
+                side_effect=requests.exceptions.HTTPError("403 Client Error"),
+            ),
+        ):
+            start = time.monotonic()
+            with pytest.raises(requests.exceptions.HTTPError):
+                client.get_all_articles()
+            assert time.monotonic() - start < 1
+    finally:
+        release.set()
+
+
+def test_get_all_articles_with_prefetch_respects_limit(session, caplog):
+    """Test that prefetching never requests pages beyond the limit."""
+    client = InstapaperClient(session)
+    client.prefetch_pages = 3
+    with caplog.at_level(logging.INFO), requests_mock.Mocker() as m:
+        setup_session_mock(m)
+        for page_num in (1, 2):
+            m.get(
+                INSTAPAPER_BOOKMARKS_URL
+                + f"?section_type=home&page={page_num}&sort=newest",
+                json=get_mock_bookmarks_json(page_num=page_num, has_more=True),
+            )
+
+        all_articles = client.get_all_articles(limit=2)
+
+        bookmark_requests = [
+            r for r in m.request_history if r.url.startswith(INSTAPAPER_BOOKMARKS_URL)
+        ]
+        assert len(bookmark_requests) == 2
+        assert "Reached page limit of 2." in caplog.text
+    assert len(all_articles) == 4
+
+
+def test_wait_for_retry_jitters_and_caps_delay(client, monkeypatch):
+    """Test that the backoff is capped at max_delay and jittered into [50%, 100%]."""
+    mock_sleep = MagicMock()
+    monkeypatch.setattr("time.sleep", mock_sleep)
+    client.backoff_factor = 1.0
+    client.max_delay = 4.0
+
+    monkeypatch.setattr("random.random", lambda: 1.0)
+    client._wait_for_retry(attempt=10, reason="test")
+    mock_sleep.assert_called_with(4.0)
+
+    monkeypatch.setattr("random.random", lambda: 0.0)
+    client._wait_for_retry(attempt=1, reason="test")
+    mock_sleep.assert_called_with(1.0)
+
+
+def test_init_max_delay_from_env(monkeypatch, session):
+    """Test that MAX_DELAY is read from the environment."""
+    monkeypatch.setenv("MAX_DELAY", "12.5")
+    assert InstapaperClient(session).max_delay == 12.5
+
+    monkeypatch.setenv("MAX_DELAY", "invalid")
+    assert InstapaperClient(session).max_delay == InstapaperClient.DEFAULT_MAX_DELAY
+
+    monkeypatch.setenv("MAX_DELAY", "-5")
+    assert InstapaperClient(session).max_delay == 0.0
+
+    for value in ("nan", "inf", "-inf"):
+        monkeypatch.setenv("MAX_DELAY", value)
+        assert InstapaperClient(session).max_delay == InstapaperClient.DEFAULT_MAX_DELAY
+
+
+def test_wait_for_retry_without_jitter(client, monkeypatch):
+    """Test that a retry_jitter of 0 gives the plain capped backoff."""
+    mock_sleep = MagicMock()
+    monkeypatch.setattr("time.sleep", mock_sleep)
+    monkeypatch.setattr("random.random", lambda: 0.0)
+    client.backoff_factor = 1.0
+    client.retry_jitter = 0.0
+
+    client._wait_for_retry(attempt=2, reason="test")
+    mock_sleep.assert_called_with(4.0)
+
+
+def test_init_retry_jitter_from_env(monkeypatch, session):
+    """Test that RETRY_JITTER is read from the environment and clamped."""
+    monkeypatch.setenv("RETRY_JITTER", "0.25")
+    assert InstapaperClient(session).retry_jitter == 0.25
+
+    monkeypatch.setenv("RETRY_JITTER", "3")
+    assert InstapaperClient(session).retry_jitter == 1.0
+
+    monkeypatch.setenv("RETRY_JITTER", "invalid")
+    assert (
+        InstapaperClient(session).retry_jitter == InstapaperClient.DEFAULT_RETRY_JITTER
+    )
+
+
+def test_init_prefetch_pages_from_env(monkeypatch, session):
+    """Test that PREFETCH_PAGES is read from the environment."""
+    monkeypatch.setenv("PREFETCH_PAGES", "4")
+    assert InstapaperClient(session).prefetch_pages == 4
+
+    monkeypatch.setenv("PREFETCH_PAGES", "invalid")
+    assert (
+        InstapaperClient(session).prefetch_pages
+        == InstapaperClient.DEFAULT_PREFETCH_PAGES
+    )
+
+
+def test_init_prefetch_pages_argument_overrides_env(monkeypatch, session, caplog):
+    """Test that an explicit prefetch_pages skips the PREFETCH_PAGES lookup."""
+    monkeypatch.setenv("PREFETCH_PAGES", "invalid")
+    with caplog.at_level(logging.WARNING):
+        client = InstapaperClient(session, prefetch_pages=5)
+
+    assert client.prefetch_pages == 5
+    assert "PREFETCH_PAGES" not in caplog.text
+
+
 def test_get_all_articles_with_limit(client, session, caplog):
     """Test that get_all_articles respects the page limit."""
     with caplog.at_level(logging.INFO):
@@ -382,6 +627,8 @@ def test_get_articles_connection_error_retries(client, session, monkeypatch, cap
     """Test that get_articles retries on ConnectionError."""
     mock_sleep = MagicMock()
     monkeypatch.setattr("time.sleep", mock_sleep)
+    # Disable jitter so the logged delay is the full backoff
+    monkeypatch.setattr("random.random", lambda: 1.0)
 
     with requests_mock.Mocker() as m:
         setup_session_mock(m)
@@ -529,6 +776,8 @@ def test_handle_http_error_429_no_retry_after_header(
     """Test handling of 429 error without Retry-After header, falls back to exponential backoff."""
     mock_sleep = MagicMock()
     monkeypatch.setattr("time.sleep", mock_sleep)
+    # Disable jitter so the logged delay is the full backoff
+    monkeypatch.setattr("random.random", lambda: 1.0)
 
     with requests_mock.Mocker() as m:
         setup_session_mock(m)
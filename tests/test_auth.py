@@ -1,5 +1,7 @@
 import logging
 import stat
+import threading
+import time
 from unittest.mock import MagicMock
 from urllib.parse import parse_qs
 
@@ -122,6 +124,67 @@ def test_save_and_load_session(authenticator, session_file, key_file):
     assert new_session.cookies.get("pfps") == "pass123"
 
 
+def test_save_session_creates_owner_only_file(authenticator, session_file, monkeypatch):
+    """Test that the session file is created owner-only, even before chmod."""
+    monkeypatch.setattr("os.chmod", MagicMock())
+    authenticator.session.cookies.set("pfus", "user123", domain=".instapaper.com")
+
+    authenticator._save_session()
+
+    file_mode = session_file.stat().st_mode
+    assert (
+        file_mode & (stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO)
+        == stat.S_IRUSR | stat.S_IWUSR
+    )
+
+
+def test_save_and_load_session_keeps_cookie_attributes(
+    authenticator, session_file, key_file
+):
+    """Test that path, expiry and secure flags survive a save/load round trip."""
+    authenticator.session.cookies.set(
+        "pfus",
+        "user123",
+        domain=".instapaper.com",
+        path="/u",
+        expires=4102444800,
+        secure=True,
+    )
+    authenticator._save_session()
+
+    new_session = requests.Session()
+    new_auth = InstapaperAuthenticator(
+        new_session, session_file=str(session_file), key_file=str(key_file)
+    )
+    with requests_mock.Mocker() as m:
+        m.get("https://www.instapaper.com/u", text="logged in page")
+        assert new_auth._load_session() is True
+
+    (cookie,) = list(new_session.cookies)
+    assert cookie.domain == ".instapaper.com"
+    assert cookie.path == "/u"
+    assert cookie.expires == 4102444800
+    assert cookie.secure is True
+
+
+def test_load_session_legacy_text_format(authenticator, session_file, key_file):
+    """Test that a session saved in the old name:value:domain format still loads."""
+    legacy_data = (
+        "pfus:user123:.instapaper.com\n\npfps:pass123:.instapaper.com\n"
+        "pfhs:hash:with:colons:.instapaper.com\n"
+    )
+    with open(session_file, "wb") as f:
+        f.write(authenticator.fernet.encrypt(legacy_data.encode("utf-8")))
+
+    with requests_mock.Mocker() as m:
+        m.get("https://www.instapaper.com/u", text="logged in page")
+        assert authenticator._load_session() is True
+
+    assert authenticator.session.cookies.get("pfus") == "user123"
+    assert authenticator.session.cookies.get("pfps") == "pass123"
+    assert authenticator.session.cookies.get("pfhs") == "hash:with:colons"
+
+
 def test_load_session_verification_fails(authenticator, session_file, key_file):
     """Test that loading a session fails if verification fails."""
     # Save a valid session first
@@ -215,6 +278,68 @@ def test_login_with_credentials_interactive_input(authenticator, session, monkey
         assert post_data["_xsrf"] == ["test_xsrf"]
 
 
+def test_login_prompt_interrupt_does_not_wait_for_preflight(authenticator, monkeypatch):
+    """Test that Ctrl-C at the prompt is not held up by a slow CSRF preflight."""
+    authenticator.username = None
+    authenticator.password = None
+    release = threading.Event()
+
+    def slow_get(*args, **kwargs):
+        release.wait(timeout=5)
+        raise requests.exceptions.ConnectionError("too slow")
+
+    monkeypatch.setattr(authenticator.session, "get", slow_get)
+    monkeypatch.setattr("builtins.input", MagicMock(side_effect=KeyboardInterrupt))
+
+    start = time.monotonic()
+    try:
+        with pytest.raises(KeyboardInterrupt):
+            authenticator._login_with_credentials()
+        assert time.monotonic() - start < 1
+    finally:
+        release.set()
+
+
+def test_login_prompt_defers_preflight_errors(
+    authenticator, session, monkeypatch, caplog
+):
+    """Test that a failed preflight is logged only after the prompt completes."""
+    authenticator.username = None
+    authenticator.password = None
+    logged_during_prompt = []
+
+    def prompt(text):
+        # Give the preflight time to fail while the prompt is still open
+        time.sleep(0.1)
+        logged_during_prompt.append(caplog.text)
+        return "value"
+
+    monkeypatch.setattr("builtins.input", prompt)
+    monkeypatch.setattr("getpass.getpass", prompt)
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            "https://www.instapaper.com/user/login",
+            exc=requests.exceptions.ConnectionError("boom"),
+        )
+        with caplog.at_level(logging.ERROR):
+            assert authenticator._login_with_credentials() is False
+
+    assert all("CSRF" not in text for text in logged_during_prompt)
+    assert "Could not fetch login page for CSRF token" in caplog.text
+
+
+def test_verify_session_finds_marker_across_chunks(authenticator, monkeypatch):
+    """Test that a login form marker split across streamed chunks is detected."""
+    monkeypatch.setattr(InstapaperAuthenticator, "VERIFY_CHUNK_SIZE", 4)
+    with requests_mock.Mocker() as m:
+        m.get("https://www.instapaper.com/u", text='<div id="login_form"></div>')
+        assert authenticator._verify_session() is False
+
+        m.get("https://www.instapaper.com/u", text="<div>logged in page</div>")
+        assert authenticator._verify_session() is True
+
+
 def test_verify_session_request_exception(authenticator, caplog):
     """Test _verify_session handles requests.RequestException."""
     with requests_mock.Mocker() as m:
@@ -451,6 +451,61 @@ def test_load_config_from_args_config_file(tmp_path):
     assert result == {"folders": {"key": "test"}}
 
 
+def test_load_config_skips_directory_candidate(tmp_path, monkeypatch):
+    """Test load_config moves past a candidate path that is a directory."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text("output_filename = 'out.csv'")
+    monkeypatch.setattr("instapaper_scraper.cli.CONFIG_DIR", tmp_path)
+    monkeypatch.chdir(tmp_path.parent)
+
+    result = cli.load_config(str(tmp_path))
+    assert result == {"output_filename": "out.csv"}
+
+
+def test_load_config_reparses_modified_file(tmp_path):
+    """Test that a modified config file is parsed again."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text("output_filename = 'a.csv'")
+    assert cli.load_config(str(config_file)) == {"output_filename": "a.csv"}
+
+    config_file.write_text("output_filename = 'bb.csv'")
+    assert cli.load_config(str(config_file)) == {"output_filename": "bb.csv"}
+
+
+def test_load_config_skips_directory_candidate_on_windows(tmp_path, monkeypatch):
+    """Test that a directory is skipped when open() raises PermissionError."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text("output_filename = 'out.csv'")
+    monkeypatch.setattr("instapaper_scraper.cli.CONFIG_DIR", tmp_path)
+    monkeypatch.chdir(tmp_path.parent)
+
+    real_open = open
+
+    def windows_open(path, *args, **kwargs):
+        if Path(path).is_dir():
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("instapaper_scraper.cli.open", windows_open, raising=False)
+
+    result = cli.load_config(str(tmp_path))
+    assert result == {"output_filename": "out.csv"}
+
+
+def test_load_config_permission_error_on_file_is_raised(tmp_path, monkeypatch):
+    """Test that a PermissionError on an actual file is not swallowed."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text("output_filename = 'out.csv'")
+
+    def denied_open(path, *args, **kwargs):
+        raise PermissionError(13, "Permission denied", str(path))
+
+    monkeypatch.setattr("instapaper_scraper.cli.open", denied_open, raising=False)
+
+    with pytest.raises(PermissionError):
+        cli.load_config(str(config_file))
+
+
 def test_load_config_empty_toml(tmp_path):
     """Test load_config with an empty but valid TOML file."""
     empty_toml = tmp_path / "empty.toml"
@@ -626,6 +681,89 @@ def test_cli_save_articles_exception(
     assert "An unexpected error occurred during saving: Something broke" in caplog.text
 
 
+def test_cli_with_prefetch(mock_auth, mock_client, mock_save, monkeypatch):
+    """Test that --prefetch sets the client's prefetch depth."""
+    mock_auth.return_value.login.return_value = True
+    mock_client.return_value.get_all_articles.return_value = [
+        {"id": "1", "title": "Test", "url": "http://test.com"}
+    ]
+    monkeypatch.setattr("sys.argv", ["instapaper-scraper", "--prefetch", "3"])
+
+    with patch("instapaper_scraper.cli.load_config", return_value={}):
+        cli.main()
+
+    assert mock_client.call_args.kwargs["prefetch_pages"] == 3
+
+
+def test_cli_prefetch_from_env_sizes_pool(
+    mock_auth, mock_client, mock_save, monkeypatch
+):
+    """Test that PREFETCH_PAGES sizes both the connection pool and the client."""
+    mock_auth.return_value.login.return_value = True
+    mock_client.return_value.get_all_articles.return_value = [
+        {"id": "1", "title": "Test", "url": "http://test.com"}
+    ]
+    mock_create_session = MagicMock()
+    monkeypatch.setattr("instapaper_scraper.cli._create_session", mock_create_session)
+    monkeypatch.setenv("PREFETCH_PAGES", "20")
+    monkeypatch.setattr("sys.argv", ["instapaper-scraper"])
+
+    with patch("instapaper_scraper.cli.load_config", return_value={}):
+        cli.main()
+
+    mock_create_session.assert_called_once_with(20)
+    assert mock_client.call_args.kwargs["prefetch_pages"] == 20
+
+
+def test_cli_prefetch_flag_skips_env_parsing(
+    mock_auth, mock_client, mock_save, monkeypatch, caplog
+):
+    """Test that --prefetch overrides PREFETCH_PAGES without reading it."""
+    mock_auth.return_value.login.return_value = True
+    mock_client.return_value.get_all_articles.return_value = [
+        {"id": "1", "title": "Test", "url": "http://test.com"}
+    ]
+    monkeypatch.setenv("PREFETCH_PAGES", "invalid")
+    monkeypatch.setattr("sys.argv", ["instapaper-scraper", "--prefetch", "2"])
+
+    with patch("instapaper_scraper.cli.load_config", return_value={}):
+        cli.main()
+
+    assert "PREFETCH_PAGES" not in caplog.text
+    assert mock_client.call_args.kwargs["prefetch_pages"] == 2
+
+
+def test_cli_closes_session_on_exit(mock_auth, monkeypatch):
+    """Test that the HTTP session is closed even when the CLI exits early."""
+    mock_auth.return_value.login.return_value = False
+    mock_session = MagicMock()
+    monkeypatch.setattr("instapaper_scraper.cli._create_session", mock_session)
+    monkeypatch.setattr("sys.argv", ["instapaper-scraper"])
+
+    with patch("instapaper_scraper.cli.load_config", return_value={}):
+        with pytest.raises(SystemExit):
+            cli.main()
+
+    mock_session.return_value.close.assert_called_once()
+
+
+def test_create_session_mounts_pooled_adapter():
+    """Test that the CLI session uses a single-host keep-alive pool."""
+    session = cli._create_session()
+    adapter = session.get_adapter("https://www.instapaper.com")
+
+    assert adapter._pool_connections == cli.HTTP_POOL_CONNECTIONS
+    assert adapter._pool_maxsize == cli.HTTP_POOL_MAXSIZE
+
+
+def test_create_session_pool_fits_prefetch():
+    """Test that the pool grows to hold every concurrent prefetch request."""
+    session = cli._create_session(prefetch_pages=15)
+    adapter = session.get_adapter("https://www.instapaper.com")
+
+    assert adapter._pool_maxsize == 16
+
+
 def test_cli_main_block_execution():
     """Test the 'if __name__ == "__main__":' block."""
 
@@ -94,6 +94,7 @@ def test_get_sqlite_create_table_sql_without_url():
     """Test CREATE TABLE SQL without instapaper_url."""
     sql = get_sqlite_create_table_sql(add_instapaper_url=False)
     assert "instapaper_url" not in sql
+    assert sql.endswith(") WITHOUT ROWID")
 
 
 def test_get_sqlite_create_table_sql_with_url_modern_sqlite(mock_sqlite3):
@@ -109,7 +110,7 @@ def test_get_sqlite_create_table_sql_with_url_old_sqlite(mock_sqlite3):
     configure_mock, _ = mock_sqlite3
     configure_mock((3, 30, 0))
     sql = get_sqlite_create_table_sql(add_instapaper_url=True)
-    expected_sql = "CREATE TABLE IF NOT EXISTS articles (id TEXT PRIMARY KEY, title TEXT NOT NULL, url TEXT NOT NULL, instapaper_url TEXT)"
+    expected_sql = "CREATE TABLE IF NOT EXISTS articles (id TEXT PRIMARY KEY, title TEXT NOT NULL, url TEXT NOT NULL, instapaper_url TEXT) WITHOUT ROWID"
     assert sql == expected_sql
 
 
@@ -157,12 +158,12 @@ def test_save_to_csv_with_instapaper_url(sample_articles, output_dir):
     """Test saving articles to a CSV file with an Instapaper URL."""
     csv_file = output_dir / "bookmarks_with_prefix.csv"
     articles = sample_articles()
-    # In a real scenario, the caller (save_articles) adds this dict key
     articles_with_url = [
         {**a, "instapaper_url": f"{INSTAPAPER_READ_URL}{a['id']}"} for a in articles
     ]
 
-    save_to_csv(articles_with_url, str(csv_file), add_instapaper_url=True)
+    # save_to_csv derives the URL from the id while writing each row
+    save_to_csv(articles, str(csv_file), add_instapaper_url=True)
 
     assert csv_file.exists()
 
@@ -182,6 +183,15 @@ def test_save_to_csv_with_instapaper_url(sample_articles, output_dir):
         assert content == expected_content
 
 
+def test_save_to_csv_bare_filename(sample_articles, tmp_path, monkeypatch):
+    """Test saving to a filename without a directory component."""
+    monkeypatch.chdir(tmp_path)
+
+    save_to_csv(sample_articles(), "bookmarks.csv")
+
+    assert (tmp_path / "bookmarks.csv").exists()
+
+
 def test_save_to_json(sample_articles, output_dir):
     """Test saving articles to a JSON file."""
     json_file = output_dir / "bookmarks.json"
@@ -309,6 +319,24 @@ def test_save_to_sqlite_with_instapaper_url_old_sqlite(
     )
 
 
+def test_save_to_sqlite_closes_connection_on_error(
+    mock_sqlite3, sample_articles, output_dir
+):
+    """Test that the connection is closed when the insert fails."""
+    configure_mock, mock_sqlite = mock_sqlite3
+    configure_mock((3, 31, 0))
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_cursor.executemany.side_effect = RuntimeError("insert failed")
+    mock_sqlite.connect.return_value = mock_conn
+    mock_conn.cursor.return_value = mock_cursor
+
+    with pytest.raises(RuntimeError):
+        save_to_sqlite(sample_articles(), str(output_dir / "test.db"))
+
+    mock_conn.close.assert_called_once()
+
+
 @pytest.mark.parametrize("add_instapaper_url", [True, False])
 @pytest.mark.parametrize(
     "format, expected_filename",